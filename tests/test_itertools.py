@@ -1,11 +1,14 @@
 import sys
 import random
 
+import pytest
+
 sys.path.append(".")  # Adjust the path to import from the parent directory
 
-from ttools.itertools import sim_product
+from ttools.flatten import dot, flatten
+from ttools.itertools import sim_product, sim_product_array, sim_product_list
 from ttools.min_max import *
-from ttools.sort import sort_by
+from ttools.sort import sort_by, sort_together
 
 def test_sim_product():
     num = 20
@@ -22,6 +25,51 @@ def test_sim_product():
                     raise ValueError(msg)
 
 
+def test_sim_product_order():
+    assert list(sim_product([0, 1, 2], [0, 1, 2])) == [(0, 0), (1, 1), (2, 2), (0, 1), (1, 2), (2, 0), (0, 2), (1, 0), (2, 1)]
+    assert list(sim_product([0, 1], [0, 1, 2])) == [(0, 0), (1, 1), (0, 2), (1, 0), (0, 1), (1, 2)]
+    assert list(sim_product([0, 1], [0, 1, 2], [0, 1])) == [
+        (0, 0, 0), (1, 1, 1), (0, 2, 0), (1, 0, 1), (0, 1, 0), (1, 2, 1),
+        (0, 0, 1), (1, 1, 0), (0, 2, 1), (1, 0, 0), (0, 1, 1), (1, 2, 0),
+    ]
+
+
+def test_sim_product_list():
+    values = sim_product_list([0, 1], [0, 1, 2])
+    assert values == list(sim_product([0, 1], [0, 1, 2]))
+    assert sim_product_list([0, 1], [0, 1, 2], num=15) == values + values + values[:3]
+    assert sim_product_list([0, 1], [0, 1, 2], num=4) == values[:4]
+
+    args = [list(range(2)), list(range(3)), list(range(4)), list(range(6))]
+    values = sim_product_list(*args) * 2
+    for start in range(len(values) // 2):
+        assert sim_product_list(*args, num=7, start=start) == values[start:start + 7]
+
+
+def test_sim_product_array():
+    np = pytest.importorskip("numpy")
+    for args in ([[0, 1], [0, 1, 2]], [np.arange(3), [0.5, 1.5], np.arange(4)]):
+        for num in (None, 5, 30):
+            for start in (0, 4):
+                expected = np.array(sim_product_list(*args, num=num, start=start))
+                assert np.array_equal(sim_product_array(*args, num=num, start=start), expected)
+    assert sim_product_array().shape == (0, 0)
+    assert sim_product_array(num=3).shape == (0, 0)
+
+
+class SequenceWithoutIndex:
+    """A sequence that only supports `len` and indexing."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+
 def test_min_max():
     for _ in range(10):
         values = [random.randint(0, 100) for _ in range(100)]
@@ -32,6 +80,12 @@ def test_min_max():
         assert(min_value == values[arg_min(values)])
         assert(max_value == values[arg_none_max(values)])
         assert(min_value == values[arg_none_min(values)])
+        assert(values.index(max_value) == arg_max(values))
+        assert(values.index(min_value) == arg_min(values))
+        assert(values.index(min_value) == arg_max(values, key=lambda x: -x))
+        assert(arg_max(iter(values)) == arg_max(values))
+        assert(arg_minmax(values) == (arg_min(values), arg_max(values)))
+        assert(arg_minmax(iter(values)) == (arg_min(values), arg_max(values)))
 
         for i in range(20):
             values[random.randint(0, 99)] = None
@@ -46,10 +100,113 @@ def test_min_max():
         assert(all(x is None or x <= max_value for x in values))
         assert(all(x is None or min_value <= x for x in values))
 
+    # Ties return the first index, for all input types
+    values = [None, 2, 5, None, 1, 5, 1, 2]
+    for wrapped in (values, tuple(values), iter(values)):
+        assert arg_none_min(wrapped) == 4
+    for wrapped in (values, tuple(values), iter(values)):
+        assert arg_none_max(wrapped) == 2
+    assert arg_none_min(values, key=lambda x: -x) == 2
+    values = [2, 5, 1, 5, 1, 2]
+    for wrapped in (values, tuple(values), iter(values)):
+        assert arg_minmax(wrapped) == (2, 1)
+
+    # Infinite values next to None values, also for sequences without an `index` method
+    values = [None, float("inf"), None]
+    for wrapped in (values, SequenceWithoutIndex(values), iter(values)):
+        assert arg_none_min(wrapped) == 1
+    values = [None, float("-inf"), None]
+    for wrapped in (values, SequenceWithoutIndex(values), iter(values)):
+        assert arg_none_max(wrapped) == 1
+
+    assert arg_none_min("bca") == 2
+    assert arg_none_max(b"abc") == 2
+
+    assert none_min([None, 3, -4, None], key=abs) == 3
+    assert none_max([None, float("-inf")]) == float("-inf")
+    assert none_max([None, None]) is None
+
 
 def test_sort():
     values = list(range(100))
     vals = values.copy()
     random.shuffle(values)
     val2 = sort_by(values, values.copy())[0]
-    assert(all(x == y for x, y in zip(vals, val2)))
\ No newline at end of file
+    assert(all(x == y for x, y in zip(vals, val2)))
+
+
+def test_flatten():
+    values = [1, [2, (3, 4.0)], [[[None]]], range(5, 7), {8}]
+    assert flatten(values) == [1, 2, 3, 4.0, None, 5, 6, 8]
+    assert flatten(values, max_dept=2) == [1, 2, (3, 4.0), [[None]], 5, 6, 8]
+    assert flatten(["ab", [b"cd", ["ef"]]]) == ["ab", b"cd", "ef"]
+
+    deep = [0]
+    for _ in range(10_000):
+        deep = [deep]
+    assert flatten(deep) == [0]
+
+
+def test_dot():
+    assert dot([1, 2, 3], [4, 5, 6]) == 32
+    assert dot(["a", "b"], [2, 1]) == "aab"
+    with pytest.raises(ValueError):
+        dot([1, 2], [1, 2, 3])
+
+    np = pytest.importorskip("numpy")
+    assert dot(np.arange(3), np.arange(1, 4)) == 8
+    assert type(dot(np.arange(3), np.arange(1, 4))) is int
+    assert type(dot(np.ones(3), np.ones(3))) is float
+    with pytest.raises(ValueError):
+        dot(np.arange(2), np.arange(3))
+    for empty in ([], np.array([])):
+        with pytest.raises(TypeError):
+            dot(empty, empty)
+
+
+
+def test_min_max_numpy():
+    np = pytest.importorskip("numpy")
+    values = np.array([3, 1, 4, 1, 5, 9, 2, 6, 5])
+    assert arg_min(values) == 1
+    assert arg_max(values) == 5
+    # NaN values should be compared the same with and without a key, and as in a list
+    for values in (np.array([1.0, np.nan, 0.5]), np.array([np.nan, 2.0, 1.0]), np.array([2.0, 1.0, np.nan, 3.0])):
+        for func in (arg_min, arg_max):
+            assert func(values) == func(values, key=lambda x: x) == func(list(values), key=lambda x: x)
+        assert arg_minmax(values) == arg_minmax(values, key=lambda x: x)
+    assert arg_min(np.array([1.0, np.nan, 0.5])) == 2
+
+    values = np.array([3.0, 1.0, 1.0, 5.0])
+    assert arg_none_min(values) == 1
+    assert arg_none_max(values) == 3
+    # Only None values are ignored, NaN values should be compared the same with and without a key, and as in a list
+    for values in (np.array([np.nan, 1.0]), np.array([1.0, np.nan, 0.5]), np.full(3, np.nan)):
+        for func in (arg_none_min, arg_none_max):
+            assert func(values) == func(values, key=lambda x: x) == func(list(values))
+    assert arg_none_min(np.array([np.nan, 1.0])) == 0
+    assert arg_none_max(np.array([None, -np.inf], dtype=object), key=float) == 1
+    assert arg_none_min(np.array(["b", None, "a"], dtype=object), key=str.upper) == 2
+
+    values = np.array([None, 3, 1.5, None, 5, 1.5], dtype=object)
+    assert arg_none_min(values) == 2
+    assert arg_none_max(values) == 4
+    # Only None values are missing in object arrays, NaN values should be compared as with a key and in a list
+    for values in (np.array([None, np.nan, 1.0], dtype=object), np.array([2.0, None, 1.0, np.nan], dtype=object)):
+        for func in (arg_none_min, arg_none_max):
+            assert func(values) == func(values, key=lambda x: x) == func(list(values))
+    assert arg_none_min(np.array([None, np.nan, 1.0], dtype=object)) == 1
+    # Values that would change or fail when cast to float, should be compared as they are
+    assert arg_none_max(np.array(["10", "9", None], dtype=object)) == 1
+    assert arg_none_min(np.array([2**60 + 1, 2**60, None], dtype=object)) == 1
+    assert arg_none_min(np.array([10**400, 1, None], dtype=object)) == 1
+
+
+def test_sort_numpy():
+    np = pytest.importorskip("numpy")
+    sorter = [random.randint(0, 10) for _ in range(100)]
+    other = list(range(100))
+    for reverse in (False, True):
+        expected = sort_together(sorter, other, np.array(other), reverse=reverse)
+        result = sort_together(np.array(sorter), other, np.array(other), reverse=reverse)
+        assert result == expected
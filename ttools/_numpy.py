@@ -0,0 +1,30 @@
+"""
+Optional NumPy support. NumPy is not a dependency of this package, so arrays are only detected when NumPy has already
+been imported by the caller (which is always the case when an array is passed in).
+"""
+
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# NumPy dtype kinds of bools, (unsigned) integers, floats and complex numbers
+NUMERIC_KINDS = "biufc"
+
+
+def is_ndarray(value: object) -> bool:
+    """Check whether `value` is a NumPy array, without importing NumPy."""
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+def is_numeric_array(value: object) -> bool:
+    """Check whether `value` is a NumPy array with a numeric dtype, without importing NumPy."""
+    return is_ndarray(value) and value.dtype.kind in NUMERIC_KINDS
+
+
+def has_nan(array: "np.ndarray") -> bool:
+    """Check whether a numeric NumPy array contains NaN values, without importing NumPy."""
+    # NaN is the only value that is not equal to itself
+    return array.dtype.kind in "fc" and bool((array != array).any())
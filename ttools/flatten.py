@@ -3,17 +3,25 @@ Flattening and transposing utilities.
 """
 
 import functools
+import itertools
 import math
 import operator
 from collections.abc import Iterable
 from typing import Any, overload
 
-from _protecols import Addable
+from ._numpy import is_numeric_array
+from ._protecols import Addable
+
+# Types that can be classified without going through the (slow) `Iterable` ABC check. Strings are treated as single
+# values, since iterating over them yields strings again.
+_STRING_TYPES = (str, bytes, bytearray)
+_SCALAR_TYPES = frozenset((int, float, complex, bool, type(None), *_STRING_TYPES))
+_ITERABLE_TYPES = frozenset((list, tuple, set, frozenset, dict, range))
 
 
 def flatten_2D(value: Iterable[Iterable[Any]], /) -> list[Any]:  #noqa: N802
     """Flatten an iterator of iterators."""
-    return [item for sublist in value for item in sublist]
+    return list(itertools.chain.from_iterable(value))
 
 
 def flatten_iter(value: Iterable, /, *, max_dept=math.inf) -> Iterable:
@@ -26,16 +34,32 @@ def flatten_iter(value: Iterable, /, *, max_dept=math.inf) -> Iterable:
         The iterable to flatten.
     max_dept : int, optional
         The maximum depth to flatten. Defaults to infinity, meaning it will flatten all levels.
+
+    Notes
+    -----
+    Strings and bytes are not flattened into their characters, they are yielded as a single value.
     """
     if max_dept <= 0:
         yield value
         return
 
-    for item in value:
-        if isinstance(item, Iterable):
-            yield from flatten_iter(item, max_dept=max_dept - 1)
+    # Depth first search with an explicit stack of iterators, to not be limited by the recursion depth
+    stack = [iter(value)]
+    while stack:
+        for item in stack[-1]:
+            item_type = type(item)
+            if item_type in _SCALAR_TYPES:
+                yield item
+            elif len(stack) < max_dept and (
+                item_type in _ITERABLE_TYPES
+                or (isinstance(item, Iterable) and not isinstance(item, _STRING_TYPES))
+            ):
+                stack.append(iter(item))
+                break
+            else:
+                yield item
         else:
-            yield item
+            stack.pop()
 
 
 def flatten(value: Iterable, /, *, max_dept=math.inf) -> list:
@@ -71,17 +95,28 @@ def dot[T](
     /,
 ) -> T:
     """
-    Calculate the dot product of two vectors.
+    Calculate the dot product of two vectors. When both vectors are numeric NumPy arrays, `numpy.dot` is used, and
+    the result is returned as a Python scalar.
 
     Raises
     ------
     ValueError
         When the two vectors are not of the same length.
     TypeError
-        When the values in the two vecs cannot be added together.
+        When the values in the two vecs cannot be added together, or when both vectors are empty.
     """
+    if is_numeric_array(vec1) and is_numeric_array(vec2) and vec1.ndim == vec2.ndim == 1:
+        if vec1.shape != vec2.shape:
+            msg = "Both vectors must have the same length"
+            raise ValueError(msg)
+        if vec1.size == 0:
+            # Same as the generic path, where `reduce` cannot reduce an empty iterable
+            msg = "Cannot calculate the dot product of empty vectors"
+            raise TypeError(msg)
+        return vec1.dot(vec2).item()
+
     try:
-        return functools.reduce(operator.add, [a * b for a, b in zip(vec1, vec2, strict=True)])
+        return functools.reduce(operator.add, itertools.starmap(operator.mul, zip(vec1, vec2, strict=True)))
     except ValueError as e:
         msg = "Both vectors must have the same length"
         raise ValueError(msg) from e
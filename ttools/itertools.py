@@ -4,10 +4,14 @@ multiple iterables.
 """
 
 import functools
+import itertools
 import math
 import operator
 from collections.abc import Iterator, Sequence
-from typing import overload
+from typing import TYPE_CHECKING, overload
+
+if TYPE_CHECKING:
+    import numpy as np
 
 
 @overload
@@ -74,10 +78,17 @@ def sim_product(*args: Sequence, stop=True) -> Iterator[tuple]:
     tuple
         A tuple containing one element from each of the input sequences, in a specific order.
 
+    See Also
+    --------
+    sim_product_array : The same combinations as a NumPy array, without creating a tuple per combination.
+
     Notes
     -----
     It will return the same cartesian product as :external+python:py:func:`itertools.product`, but in a different order.
 
+    The values of every sequence are copied into a tuple once, so sequences with slow item access (such as NumPy
+    arrays) do not slow down the iteration.
+
     Examples
     --------
     >>> list(sim_product([0, 1, 2], [0, 1, 2]))
@@ -89,55 +100,99 @@ def sim_product(*args: Sequence, stop=True) -> Iterator[tuple]:
     >>> list(sim_product([0, 1], [0, 1, 2], [0, 1]))
     [(0, 0, 0), (1, 1, 1), (0, 2, 0), (1, 0, 1), (0, 1, 0), (1, 2, 1), (0, 0, 1), (1, 1, 0), (0, 2, 1), (1, 0, 0), (0, 1, 1), (1, 2, 0)]
     """
-    if any(zero_lengths := [len(arg) == 0 for arg in args]):
-        # If any iterable is empty, the product is empty
-        indexes = [i for i, zero in enumerate(zero_lengths) if zero]
+    _check_non_empty(args)
+
+    combinations = _sim_combinations(args)
+    if stop:
+        combinations = itertools.islice(combinations, math.prod(len(arg) for arg in args))
+    yield from combinations
+
+
+def _sim_combinations(args: Sequence[Sequence], start: int = 0) -> Iterator[tuple]:
+    """
+    Create an infinite iterator over the combinations of `sim_product`, starting at step `start`.
+
+    Each sequence is a chain of rotated copies of its values (see `_sim_plan`), which can be generated and zipped
+    together without any per-combination work in Python. Since the index of each sequence only depends on the step,
+    any starting step can be reached directly.
+    """
+    periods, lcms = _sim_plan(tuple(len(arg) for arg in args))
+    columns = [
+        itertools.chain.from_iterable(_rotations(tuple(arg), period, lcm, start % period))
+        for arg, period, lcm in zip(args, periods, lcms, strict=True)
+    ]
+    return zip(*columns, strict=False)
+
+
+def _check_non_empty(args: Sequence[Sequence]) -> None:
+    """Raise a ValueError when any of the sequences is empty, since the product would be empty."""
+    # `len` instead of truthiness, since the truth value of NumPy arrays is ambiguous
+    if indexes := [i for i, arg in enumerate(args) if len(arg) == 0]:
         if len(indexes) == 1:
             mgs = f"Input sequence at index {indexes[0]} is empty, cannot compute product."
         else:
             mgs = f"Input sequences at indices {indexes} are empty, cannot compute product."
         raise ValueError(mgs)
 
-    if len(args) == 1:
-        # Only one iterable, simply yield the values from that iterable
-        index = 0
-        args_len = len(args[0])
-        while True:
-            yield (args[0][index],)  # Comma to make it a tuple
-            if stop and index == args_len - 1:
-                return
-            index = (index + 1) % args_len
-    else:
-        # More than one iterable, get the generator for the combinations of the first n-1 iterables
-        iterator = sim_product(*args[:-1], stop=False)
-        first_iterator_len = functools.reduce(operator.mul, map(len, args[:-1]))
-
-        # The number of iterations before values are repeated (when nothing is done to fix this)
-        lcm = math.lcm(first_iterator_len, len(args[-1]))
-        index = 0
-        start = 0
-        iters = 0
-
-        len_val = len(args[-1])
-        reset_val = first_iterator_len * len_val
-        while True:
-            yield *next(iterator), args[-1][index % len_val]
-            index += 1
-            iters += 1
-
-            if iters % lcm == 0:
-                # The new value would be a repeat, so we need to move the start index to prevent repetition
-                start += 1
-                index = start
-
-            if iters == reset_val:
-                if stop:
-                    return
-                # We have looped through all the unique combinations, so we need to reset to the start
-                index, start, iters = 0, 0, 0
-
-
-def sim_product_list(*args: Sequence, num: int | None = None) -> list[tuple]:
+
+@functools.lru_cache(maxsize=256)
+def _sim_plan(lens: tuple[int, ...]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Calculate the `period` and `lcm` of each sequence of `sim_product`.
+
+    The index for each sequence only depends on the step modulo the number of combinations of that sequence with the
+    ones before it (`period`), and it shifts by one every `lcm` steps to prevent the combinations from repeating before
+    all of them have been yielded. At step `k`, the index of a sequence with length `length` is thus given by
+    ``(k % period + k % period // lcm) % length``.
+
+    The plan only depends on the lengths of the sequences, so it is cached for repeated calls with the same shape.
+    """
+    periods = tuple(itertools.accumulate(lens, operator.mul))
+    lcms = tuple(math.lcm(period // length, length) for period, length in zip(periods, lens, strict=True))
+    return periods, lcms
+
+
+def _rotations(values: tuple, period: int, lcm: int, start: int = 0) -> Iterator[tuple]:
+    """
+    Yield the values of one sequence of `sim_product` as consecutive chunks of the rotated values, starting at step
+    `start` (which should be smaller than `period`) and looping forever.
+    """
+    length = len(values)
+    repeats = lcm // length
+    blocks = period // lcm
+    block, offset = divmod(start, lcm)
+    shift = block % length
+    if offset:
+        # Finish the rotation block that the start step falls in
+        rotated = values[shift:] + values[:shift]
+        skipped, index = divmod(offset, length)
+        yield rotated[index:]
+        yield from itertools.repeat(rotated, repeats - skipped - 1)
+        block += 1
+        shift += 1
+        if shift == length:
+            shift = 0
+
+    while True:
+        for _ in range(block, blocks):
+            yield from itertools.repeat(values[shift:] + values[:shift], repeats)
+            shift += 1
+            if shift == length:
+                shift = 0
+        block, shift = 0, 0
+
+
+def _check_num_start(num: int | None, start: int) -> None:
+    """Raise a ValueError when `num` is not a positive integer or None, or `start` is not a non-negative integer."""
+    if num is not None and (not isinstance(num, int) or num < 1):
+        msg = f"`num` should be a positive integer or None, got {num}"
+        raise ValueError(msg)
+    if not isinstance(start, int) or start < 0:
+        msg = f"`start` should be a non-negative integer, got {start}"
+        raise ValueError(msg)
+
+
+def sim_product_list(*args: Sequence, num: int | None = None, start: int = 0) -> list[tuple]:
     """
     Create a list of all the combinations of the given iterables. Uses `sim_product` to generate the combinations.
 
@@ -148,16 +203,62 @@ def sim_product_list(*args: Sequence, num: int | None = None) -> list[tuple]:
     num: int, optional
         The number of elements to generate. If None, it will generate all combinations. If num is larger that the number
         of unique combinations, the list will contain non-unique combinations.
+    start: int, optional
+        The index of the first combination to generate. Together with `num`, this allows generating the combinations in
+        separate chunks. Defaults to 0.
 
     Returns
     -------
     list[tuple]
         A list containing tuples with one element from each of the input sequences, in a specific order.
     """
+    _check_num_start(num, start)
+    _check_non_empty(args)
     if num is None:
-        return list(sim_product(*args, stop=True))
-    if not isinstance(num, int) or num < 1:
-        msg = f"`num` should be a positive integer or None, got {num}"
-        raise ValueError(msg)
-    iterator = sim_product(*args, stop=False)
-    return [next(iterator) for _ in range(num)]
+        num = math.prod(len(arg) for arg in args)
+    return list(itertools.islice(_sim_combinations(args, start), num))
+
+
+def sim_product_array(*args: Sequence, num: int | None = None, start: int = 0) -> "np.ndarray":
+    """
+    Create a NumPy array of all the combinations of the given sequences, in the same order as `sim_product`.
+
+    Compared to `sim_product_list`, this avoids creating a tuple for every combination, which is faster and uses less
+    memory for numeric sequences. Requires NumPy.
+
+    Parameters
+    ----------
+    args:  Sequence
+        The sequences of scalars to combine.
+    num: int, optional
+        The number of elements to generate. If None, it will generate all combinations. If num is larger that the number
+        of unique combinations, the array will contain non-unique combinations.
+    start: int, optional
+        The index of the first combination to generate. Defaults to 0.
+
+    Returns
+    -------
+    np.ndarray
+        An array with shape (num, len(args)), where each row contains one element from each of the input sequences.
+        Without any sequences, the array is empty with shape (0, 0).
+    """
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError as e:
+        msg = "`sim_product_array` requires NumPy, install it with `pip install ttools[numpy]`"
+        raise ImportError(msg) from e
+
+    _check_num_start(num, start)
+    _check_non_empty(args)
+    if not args:
+        # Without sequences there are no combinations, like for `sim_product` and `sim_product_list`
+        return np.empty((0, 0))
+
+    periods, lcms = _sim_plan(tuple(len(arg) for arg in args))
+    steps = np.arange(start, start + (periods[-1] if num is None else num)) % periods[-1]
+    columns = []
+    for arg, period, lcm in zip(args, periods, lcms, strict=True):
+        values = np.asarray(arg)
+        position = steps % period
+        columns.append(values[(position + position // lcm) % len(values)])
+    return np.column_stack(columns)
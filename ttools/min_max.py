@@ -2,59 +2,27 @@
 Functions to find the minimum and maximum (index) values in a sequence, while ignoring None values.
 """
 
-from collections.abc import Callable, Generator, Iterable, Sequence
-from typing import Any, TypeVar
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from math import isnan
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from ._numpy import NUMERIC_KINDS, has_nan, is_ndarray, is_numeric_array
 from ._protecols import SupportsAllComparisonT
 
-T = TypeVar("T")
-S = TypeVar("S")
-
-
-def _none_key(key: Callable[[T], Any], default: T) -> Callable[[T], SupportsAllComparisonT]:
-    """
-    Create a new key function that returns a default value if the input is None, the original value (with the key
-    applied if given) otherwise.
-    """
-    if key is None:
-
-        def new_key(x):  #noqa: ANN202
-            if x is None:
-                return default
-            return x
-    else:
+if TYPE_CHECKING:
+    import numpy as np
 
-        def new_key(x):  #noqa: ANN202
-            if x is None:
-                return default
-            return key(x)
+T = TypeVar("T")
 
-    return new_key
-
-
-def _none_yielder(values: Iterable[T], key: Callable[[T], S], default: T) -> Generator[T | S, None, None]:
-    """
-    Yield values from the iterable, applying a key function if provided, while replacing None values with a
-    default value.
-    """
-    if key is None:
-        for val in values:
-            if val is None:
-                yield default
-            else:
-                yield val
-    else:
-        for val in values:
-            if val is None:
-                yield default
-            else:
-                yield key(val)
+_MISSING = object()
+# Largest magnitude up to which every int can be represented exactly as a float
+_MAX_EXACT_INT = 2**53
 
 
 def arg_none_max(values: Sequence[T], *, key: Callable[[T], SupportsAllComparisonT] | None = None) -> int | None:
     """
-    Find the first index of the minimum value in the sequence, using the build-in `min` function, while ignoring
-    None values.
+    Find the first index of the maximum value in the sequence, while ignoring None values. When several values are
+    equal to the maximum, the index of the first one is returned.
 
     Parameters
     ----------
@@ -68,14 +36,20 @@ def arg_none_max(values: Sequence[T], *, key: Callable[[T], SupportsAllCompariso
     -------
     int | None
         The index of the maximum value in the sequence, or None if all values are None.
+
+    Notes
+    -----
+    Only None values are ignored, NaN values are compared like any other value, also in NumPy arrays. Since every
+    comparison with NaN is false, the result then depends on the position of the NaN values, the same as for the builtin
+    `min` and `max`.
     """
-    return _arg_none_minmax(max, values, float("-inf"), key=key)
+    return _arg_none_minmax(max, values, key=key)
 
 
 def arg_none_min(values: Sequence[T], *, key: Callable[[T], Any] | None = None) -> int | None:
     """
-    Find the first index of the minimum value in the sequence, using the build-in `min` function, while ignoring
-    None values.
+    Find the first index of the minimum value in the sequence, while ignoring None values. When several values are
+    equal to the minimum, the index of the first one is returned.
 
     Parameters
     ----------
@@ -89,50 +63,159 @@ def arg_none_min(values: Sequence[T], *, key: Callable[[T], Any] | None = None)
     -------
     int | None
         The index of the minimum value in the sequence, or None if all values are None.
+
+    Notes
+    -----
+    Only None values are ignored, NaN values are compared like any other value, also in NumPy arrays. Since every
+    comparison with NaN is false, the result then depends on the position of the NaN values, the same as for the builtin
+    `min` and `max`.
     """
-    return _arg_none_minmax(min, values, float("inf"), key=key)
+    return _arg_none_minmax(min, values, key=key)
 
 
 def _arg_none_minmax(
     func: callable,
     values: Iterable[T],
-    default: T,
     *,
     key: Callable[[T], SupportsAllComparisonT] | None = None,
 ) -> int | None:
-    if not isinstance(values, Iterable):
-        msg = "`values` must be an iterable"
-        raise TypeError(msg)
-
-    if isinstance(values, Iterable) and not isinstance(values, Sequence):
-        max_val = default
-        max_idx = None
-        for index, val in enumerate(values):
-            if val is None:
-                continue
-            if func(max_val, val) != max_val:
-                max_val = val
-                max_idx = index
-        return max_idx
+    if key is None and is_ndarray(values) and values.ndim == 1:
+        array = _numeric_array(values)
+        if array is not None:
+            return _arg_none_minmax_array(func, array)
+    is_sequence, has_index = _sequence_info(values)
+    if not is_sequence:
+        return _arg_none_minmax_iter(func, values, key=key)
     if len(values) == 0:
         msg = "`values` should be non-empty"
         raise ValueError(msg)
-    if hasattr(values, "index"):
-        yielder = _none_yielder(values, key, default)
-        res = func(yielder)
-        if res == default:
+    if has_index:
+        try:
+            has_none = None in values
+        except TypeError:
+            # Containment checks of for example `str` and `bytes` only accept values of their own type
+            has_none = True
+        if not has_none:
+            # Without None values, the C builtins can do all the work
+            return values.index(func(values, key=key))
+        return _arg_none_minmax_iter(func, values, key=key)
+    # Skip the None values and apply the key once, so the C builtins can search the keys without calling back
+    indices = [index for index, val in enumerate(values) if val is not None]
+    if not indices:
+        return None
+    keyed = [values[index] for index in indices]
+    if key is not None:
+        keyed = list(map(key, keyed))
+    return indices[keyed.index(func(keyed))]
+
+
+def _sequence_info(values: Iterable) -> tuple[bool, bool]:
+    """
+    Check whether `values` is a sequence (supports `len` and integer indexing), and whether it also has an `index`
+    method. Uses attribute checks, since checks against the `collections.abc` classes are slow.
+    """
+    is_sequence = hasattr(values, "__len__") and hasattr(values, "__getitem__") and not hasattr(values, "keys")
+    return is_sequence, is_sequence and hasattr(values, "index")
+
+
+def _arg_none_minmax_iter(
+    func: callable,
+    values: Iterable[T],
+    *,
+    key: Callable[[T], SupportsAllComparisonT] | None = None,
+) -> int | None:
+    """
+    Find the first index of the minimum or maximum value in a single pass, while ignoring None values. The comparisons
+    are strict, so ties keep the earliest index.
+    """
+    if key is not None:
+        values = (None if val is None else key(val) for val in values)
+    enumerated = enumerate(values)
+    for index, best in enumerated:
+        if best is not None:
+            best_idx = index
+            break
+    else:
+        return None
+
+    search = _argmin_iter if func is min else _argmax_iter
+    return search(enumerated, best_idx, best)
+
+
+def _argmin_iter(enumerated: Iterator[tuple[int, T]], best_idx: int, best: T) -> int:
+    """Continue the search for the first index of the minimum value from an enumerate iterator, skipping None."""
+    for index, val in enumerated:
+        if val is not None and val < best:
+            best = val
+            best_idx = index
+    return best_idx
+
+
+def _argmax_iter(enumerated: Iterator[tuple[int, T]], best_idx: int, best: T) -> int:
+    """Continue the search for the first index of the maximum value from an enumerate iterator, skipping None."""
+    for index, val in enumerated:
+        if val is not None and val > best:
+            best = val
+            best_idx = index
+    return best_idx
+
+
+def _arg_none_minmax_array(func: callable, values: "np.ndarray") -> int | None:
+    """
+    Find the index of the minimum or maximum of a numeric NumPy array. NaN values stand for the None values of an object
+    array converted by `_fill_nones_numeric`, and are ignored.
+    """
+    import numpy as np  # noqa: PLC0415, NumPy is always importable when `values` is an array
+
+    if values.size == 0:
+        return None
+    if values.dtype.kind != "f":
+        # Only float arrays can contain NaN values
+        return int(values.argmin() if func is min else values.argmax())
+    if np.isnan(values).all():
+        return None
+    return int(np.nanargmin(values) if func is min else np.nanargmax(values))
+
+
+def _numeric_array(values: "np.ndarray") -> "np.ndarray | None":
+    """
+    Get a numeric array that `_arg_none_minmax_array` can search instead of `values`, or None when `values` should take
+    the generic path. Arrays with NaN values take the generic path, since NaN values are compared like other values.
+    """
+    if values.dtype.kind in NUMERIC_KINDS:
+        return None if has_nan(values) else values
+    return _fill_nones_numeric(values)
+
+
+def _fill_nones_numeric(values: "np.ndarray") -> "np.ndarray | None":
+    """
+    Convert an object array of floats, ints and None values to a float array with NaN in place of None. Returns None
+    when any other value is present, when an int cannot be represented exactly as a float, since the values are compared
+    as floats afterward, or when a float is NaN, since only None values are missing.
+    """
+    import numpy as np  # noqa: PLC0415, NumPy is always importable when `values` is an array
+
+    if values.dtype.kind != "O":
+        return None
+    for val in values:
+        if val is None:
+            continue
+        val_type = type(val)
+        if val_type is float:
+            if isnan(val):
+                return None
+        elif val_type is not int or not -_MAX_EXACT_INT <= val <= _MAX_EXACT_INT:
             return None
-        return values.index(res)
-    new_key = _none_key(key, default)
-    index = func(range(len(values)), key=new_key)
-    if values[index] is None:
+    try:
+        return np.where(np.equal(values, None), np.nan, values).astype(float)
+    except (TypeError, ValueError, OverflowError):
         return None
-    return index
 
 
 def arg_max(values: Sequence[T], *, key: Callable[[T], SupportsAllComparisonT] | None = None) -> int:
     """
-    Find the first index of the minimum value in the sequence, using the build-in `min` function.
+    Find the first index of the maximum value in the sequence. When several values are equal to the maximum, the index
+    of the first one is returned.
 
     Parameters
     ----------
@@ -141,13 +224,24 @@ def arg_max(values: Sequence[T], *, key: Callable[[T], SupportsAllComparisonT] |
     key : Callable[[T], Any]
         An optional one argument key function to extract a comparison key from each element in the sequence. If None,
         the elements themselves are compared.
+
+    Returns
+    -------
+    int
+        The index of the maximum value in the sequence.
+
+    Notes
+    -----
+    NaN values are compared like any other value, also in NumPy arrays. Since every comparison with NaN is false, the
+    result then depends on the position of the NaN values, the same as for the builtin `min` and `max`.
     """
     return _argfunc(max, values, key=key)
 
 
 def arg_min(values: Sequence[T], *, key: Callable[[T], SupportsAllComparisonT] | None = None) -> int:
     """
-    Find the first index of the minimum value in the sequence, using the build-in `min` function.
+    Find the first index of the minimum value in the sequence. When several values are equal to the minimum, the index
+    of the first one is returned.
 
     Parameters
     ----------
@@ -161,66 +255,143 @@ def arg_min(values: Sequence[T], *, key: Callable[[T], SupportsAllComparisonT] |
     -------
     int
         The index of the minimum value in the sequence.
+
+    Notes
+    -----
+    NaN values are compared like any other value, also in NumPy arrays. Since every comparison with NaN is false, the
+    result then depends on the position of the NaN values, the same as for the builtin `min` and `max`.
     """
     return _argfunc(min, values, key=key)
 
 
+def arg_minmax(values: Iterable[T], *, key: Callable[[T], SupportsAllComparisonT] | None = None) -> tuple[int, int]:
+    """
+    Find the first index of both the minimum and the maximum value in the iterable.
+
+    Parameters
+    ----------
+    values : Iterable[T]
+        The values to search.
+    key : Callable[[T], Any]
+        An optional one argument key function to extract a comparison key from each element in the sequence. If None,
+        the elements themselves are compared.
+
+    Returns
+    -------
+    tuple[int, int]
+        The index of the minimum value and the index of the maximum value.
+
+    Notes
+    -----
+    Prefer this function over separate calls to `arg_min` and `arg_max` when both are needed. Iterables are only
+    traversed once, comparing the values in pairs: the smaller one of each pair is compared to the current minimum and
+    the larger one to the current maximum, which takes three comparisons per two values instead of four.
+
+    NaN values are compared like any other value, also in NumPy arrays. Since every comparison with NaN is false, the
+    result then depends on the position of the NaN values, and can differ from that of `arg_min` and `arg_max`.
+    """
+    if key is None and is_numeric_array(values) and values.ndim == 1 and not has_nan(values):
+        if values.size == 0:
+            msg = "`values` should be non-empty"
+            raise ValueError(msg)
+        return int(values.argmin()), int(values.argmax())
+    if _sequence_info(values)[1]:
+        # Two scans with the C builtins are faster than a single scan in Python
+        if len(values) == 0:
+            msg = "`values` should be non-empty"
+            raise ValueError(msg)
+        return values.index(min(values, key=key)), values.index(max(values, key=key))
+    return _arg_minmax_pairwise(values if key is None else map(key, values))
+
+
+def _arg_minmax_pairwise(values: Iterable[SupportsAllComparisonT]) -> tuple[int, int]:  #noqa: C901, PLR0912
+    """Find the first index of the minimum and maximum value, comparing the values in pairs."""
+    values_iter = iter(values)
+    try:
+        low = high = next(values_iter)
+    except StopIteration:
+        msg = "`values` should be non-empty"
+        raise ValueError(msg) from None
+
+    low_idx = high_idx = 0
+    index = 1
+    for first in values_iter:
+        second = next(values_iter, _MISSING)
+        if second is _MISSING:
+            # Odd number of values, the last one has no partner
+            if first < low:
+                low, low_idx = first, index
+            elif first > high:
+                high, high_idx = first, index
+            break
+
+        if second < first:
+            if second < low:
+                low, low_idx = second, index + 1
+            if first > high:
+                high, high_idx = first, index
+        else:
+            if first < low:
+                low, low_idx = first, index
+            # For equal values, the first one is the first index of the maximum
+            if first < second:
+                if second > high:
+                    high, high_idx = second, index + 1
+            elif first > high:
+                high, high_idx = first, index
+        index += 2
+    return low_idx, high_idx
+
+
 def _argfunc(
     func: callable,
     values: Iterable[T],
     *,
     key: Callable[[T], SupportsAllComparisonT] | None = None,
 ) -> int:
-    if not isinstance(values, Iterable):
-        msg = "`values` should be an iterable"
-        raise TypeError(msg)
-    if isinstance(values, Sequence) and len(values) == 0:
+    if key is None and is_numeric_array(values) and values.ndim == 1 and not has_nan(values):
+        if values.size == 0:
+            msg = "`values` should be non-empty"
+            raise ValueError(msg)
+        return int(values.argmin() if func is min else values.argmax())
+    is_sequence, has_index = _sequence_info(values)
+    if is_sequence and len(values) == 0:
         msg = "`values` should be non-empty"
         raise ValueError(msg)
-
-    if hasattr(values, "index"):
+    if has_index:
         return values.index(func(values, key=key))
-    if isinstance(values, Sequence):
-        return func(range(len(values)), key=values.__getitem__)
-    if isinstance(values, Iterable):
-        values_iter = iter(values)
-        try:
-            max_val = next(values_iter)
-        except StopIteration:
-            msg = "`values` should be non-empty"
-            raise ValueError(msg) from None
+    if is_sequence:
+        if key is None:
+            return func(range(len(values)), key=values.__getitem__)
+        keyed = list(map(key, values))
+        return keyed.index(func(keyed))
+
+    if key is not None:
+        values = (None if val is None else key(val) for val in values)
+    enumerated = enumerate(values)
+    try:
+        best_idx, best = next(enumerated)
+    except StopIteration:
+        msg = "`values` should be non-empty"
+        raise ValueError(msg) from None
 
-        max_idx = 0
-        for index, val in enumerate(values_iter, start=1):
-            if val is None:
-                continue
-            if func(max_val, val) != max_val:
-                max_val = val
-                max_idx = index
-        return max_idx
-    msg = "`values` should be non-empty"
-    raise TypeError(msg)
+    search = _argmin_iter if func is min else _argmax_iter
+    return search(enumerated, best_idx, best)
 
 
 def _none_minmax(
     func: callable,
     values: Sequence[T],
-    default: T,
     *,
     key: Callable[[T], SupportsAllComparisonT] | None = None,
-) -> int | None:
-    if not isinstance(values, Iterable):
-        msg = "`values` should be a iterable"
-        raise TypeError(msg)
-    yielder = _none_yielder(values, key, default)
+) -> T | None:
+    # A list lets the builtin iterate in C, which is faster than resuming a generator for every value
+    filtered = [val for val in values if val is not None]
     try:
-        res = func(yielder)
+        return func(filtered, key=key, default=None)
     except BaseException as e:
         msg = "Invalid input for function"
         raise ValueError(msg) from e
-    if res == default:
-        return None
-    return res
 
 
 def none_min(values: Sequence[T], *, key: Callable[[T], SupportsAllComparisonT] | None = None) -> T | None:
@@ -239,12 +410,8 @@ def none_min(values: Sequence[T], *, key: Callable[[T], SupportsAllComparisonT]
     -------
     T | None
         The minimum value in the sequence, or None if all values are None.
-
-    Notes
-    -----
-    If all the values are `inf`, the function will also return None.
     """
-    return _none_minmax(min, values, float("inf"), key=key)
+    return _none_minmax(min, values, key=key)
 
 
 def none_max[T](values: Sequence[T], *, key: Callable[[T], Any] | None = None) -> T | None:
@@ -263,9 +430,5 @@ def none_max[T](values: Sequence[T], *, key: Callable[[T], Any] | None = None) -
     -------
     T | None
         The maximum value in the sequence, or None if all values are None.
-
-    Notes
-    -----
-    If all the values are `-inf`, the function will also return None.
     """
-    return _none_minmax(max, values, float("-inf"), key=key)
+    return _none_minmax(max, values, key=key)
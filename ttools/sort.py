@@ -3,9 +3,14 @@ Sort sequences based on another sequence.
 """
 
 from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
+from ._numpy import is_ndarray, is_numeric_array
 from ._protecols import SupportsRichComparisonT
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 def sort_by(
     sorter: Iterable[SupportsRichComparisonT],
@@ -25,18 +30,37 @@ def sort_together(
     reverse=False,
 ) -> tuple[tuple, ...]:
     """Sort several sequences together based on the first sequence."""
-    key_sorter = (lambda x: key(x[0])) if key is not None else (lambda x: x[0])
+    if key is None and is_numeric_array(sorter) and sorter.ndim == 1 and sorter.size > 0:
+        return _sort_together_array(sorter, *others, reverse=reverse)
 
-    try:
-        zipped = zip(sorter, *others, strict=True)
-    except ValueError as e:
+    # Only sort the indices, and gather the values of every sequence with them afterward
+    sorter = list(sorter)
+    others = [list(other) for other in others]
+    if any(len(other) != len(sorter) for other in others):
         msg = "Could not zip the sequences together. Ensure they are of the same length."
-        raise ValueError(msg) from e
+        raise ValueError(msg)
 
     try:
-        sorted_values = sorted(zipped, key=key_sorter, reverse=reverse)
+        keys = sorter if key is None else list(map(key, sorter))
+        order = sorted(range(len(sorter)), key=keys.__getitem__, reverse=reverse)
     except ValueError as e:
         msg = "Could not sort the values."
         raise ValueError(msg) from e
 
-    return tuple(zip(*sorted_values, strict=False))
+    return tuple(tuple(map(values.__getitem__, order)) for values in (sorter, *others))
+
+
+def _sort_together_array(sorter: "np.ndarray", *others: Iterable, reverse=False) -> tuple[tuple, ...]:
+    """Sort several sequences together based on a numeric NumPy array, using a stable `argsort`."""
+    # When reversing, sort the reversed array and map back, so equal values keep their original order (like `sorted`)
+    order = len(sorter) - 1 - sorter[::-1].argsort(kind="stable")[::-1] if reverse else sorter.argsort(kind="stable")
+
+    indices = order.tolist()
+    result = [tuple(sorter[order])]
+    for other in others:
+        values = other if is_ndarray(other) else list(other)
+        if len(values) != len(indices):
+            msg = "Could not zip the sequences together. Ensure they are of the same length."
+            raise ValueError(msg)
+        result.append(tuple(values[order]) if is_ndarray(values) else tuple(map(values.__getitem__, indices)))
+    return tuple(result)